@@ -18,24 +18,140 @@ https://github.com/Miceuz/i2c-moisture-sensor/blob/master/README.md
 from __future__ import division
 from datetime import datetime
 
-import smbus
+import asyncio
+import ctypes
+import fcntl
+import os
+import struct
 import sys
+import threading
 import time
 
+# smbus2 is preferred when available. Its i2c_rdwr issues the register
+# write and the data read as one combined transaction with a repeated
+# start, which is faster and also required by bridges that reset the
+# register pointer on a stop condition. Plain smbus still works, using
+# SMBus block reads instead.
+try:
+    from smbus2 import SMBus, i2c_msg
+except ImportError:
+    from smbus import SMBus
+    i2c_msg = None
+
+# numpy is optional. It is only used by moist_to_percent to convert
+# whole batches of stored readings in one vectorized pass.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The sensor sends 16 bit registers big-endian, decode them in one go.
+_U16BE = struct.Struct('>H').unpack_from
+
+# Direct kernel fast path for register reads. One I2C_RDWR ioctl on the
+# raw /dev/i2c-N node performs the register write and the data read as
+# a single combined transfer, skipping the Python layers in smbus/smbus2
+# on every call. Structure layouts from linux/i2c.h and linux/i2c-dev.h.
+_I2C_RDWR = 0x0707
+_I2C_M_RD = 0x0001
+
+
+class _i2c_msg_struct(ctypes.Structure):
+    _fields_ = [('addr', ctypes.c_uint16),
+                ('flags', ctypes.c_uint16),
+                ('len', ctypes.c_uint16),
+                ('buf', ctypes.POINTER(ctypes.c_uint8))]
+
+
+class _i2c_rdwr_ioctl_data(ctypes.Structure):
+    _fields_ = [('msgs', ctypes.POINTER(_i2c_msg_struct)),
+                ('nmsgs', ctypes.c_uint32)]
+
+
+def _cread_block(fd, addr, reg, nbytes):
+    """Read a register block with one I2C_RDWR ioctl on a raw i2c fd.
+
+    Args:
+        fd (int): Open file descriptor for /dev/i2c-N
+        addr (int): I2C address
+        reg (int): Register number
+        nbytes (int): Number of bytes to read
+
+    Returns:
+        bytes: The raw register contents
+
+    Raises:
+        OSError: If the kernel or bridge rejects the combined transfer.
+    """
+    reg_buf = (ctypes.c_uint8 * 1)(reg)
+    data_buf = (ctypes.c_uint8 * nbytes)()
+    u8_ptr = ctypes.POINTER(ctypes.c_uint8)
+    msgs = (_i2c_msg_struct * 2)(
+        _i2c_msg_struct(addr, 0, 1, ctypes.cast(reg_buf, u8_ptr)),
+        _i2c_msg_struct(addr, _I2C_M_RD, nbytes,
+                        ctypes.cast(data_buf, u8_ptr)))
+    fcntl.ioctl(fd, _I2C_RDWR, _i2c_rdwr_ioctl_data(msgs, 2))
+    return bytes(data_buf)
+
+
+# One SMBus handle and one transaction lock per bus number, shared by
+# all Chirp instances. Multiple sensors on the same bus then use a
+# single file descriptor, and threads reading different sensors cannot
+# interleave their transactions on the bus.
+_BUS_CACHE = {}
+_BUS_LOCKS = {}
+_BUS_FDS = {}
+_BUS_CACHE_LOCK = threading.Lock()
+
+
+def _open_bus(bus):
+    """Get the shared SMBus handle, transaction lock and raw file
+    descriptor for a bus. The raw descriptor is None if the device node
+    could not be opened, in which case reads go through SMBus.
+
+    Args:
+        bus (int): I2C bus number
+
+    Returns:
+        tuple: (SMBus, threading.Lock, int or None) for the bus
+    """
+    with _BUS_CACHE_LOCK:
+        if bus not in _BUS_CACHE:
+            _BUS_CACHE[bus] = SMBus(bus)
+            _BUS_LOCKS[bus] = threading.Lock()
+            try:
+                _BUS_FDS[bus] = os.open('/dev/i2c-{}'.format(bus), os.O_RDWR)
+            except OSError:
+                _BUS_FDS[bus] = None
+        return _BUS_CACHE[bus], _BUS_LOCKS[bus], _BUS_FDS[bus]
+
+
+# Conversion functions from celsius to the supported temperature scales.
+_TEMP_SCALES = {
+    'celsius': lambda celsius: celsius,
+    # °F = (°C × 9/5) + 32
+    'farenheit': lambda celsius: (celsius * 9 / 5) + 32,
+    # K = °C + 273.15
+    'kelvin': lambda celsius: celsius + 273.15,
+}
+
 
 class Chirp(object):
     """Chirp soil moisture sensor with temperature and light sensors.
 
     Attributes:
         address (int): I2C address
-        busy_sleep (float): Sleep time in seconds while waiting for a new
-                            measurement. Default: 0.01 second
+        busy_sleep (float): Sleep time in seconds between busy flag polls
+                            while waiting for a new measurement.
+                            Default: 0.001 second
         light (int): Light measurement. False if no measurement taken.
         light_timestamp (datetime): Timestamp for light measurement.
+                                    None if no measurement taken.
         max_moist (int): Calibrated maximum value for moisture, required for moist_percent
         min_moist (int): Calibrated Minimum value for moisture, required for moist_percent
         moist (int): Moisture measurement. False if no measurement taken.
-        moist_timestamp (datetime): Timestamp for moist measurement
+        moist_timestamp (datetime): Timestamp for moist measurement.
+                                    None if no measurement taken.
         read_light (bool): Set to True to enable light measurement, else False.
         read_moist (bool): Set to True to enable moisture measurement, else False.
         read_temp (bool): Set to True to enable temp measurement, else False.
@@ -43,7 +159,26 @@ class Chirp(object):
         temp_offset (float): Offset for calibrating temperature.
         temp_scale (str): Temperature scale to return. Valid: 'celsius', 'farenheit' or 'kelvin'
         temp_timestamp (datetime): Timestamp for temp measurement.
+                                   None if no measurement taken.
     """
+
+    # Minimum conversion times in seconds, from the sensor datasheet.
+    # Sleeping these out up front avoids polling the bus while the
+    # measurement cannot possibly be done yet.
+    _T_MIN_MOIST = 0.003
+    _T_MIN_TEMP = 0.003
+    _T_MIN_LIGHT = 0.01
+
+    # Give up waiting for the busy flag after this many seconds. Light
+    # measurements can take several seconds in complete darkness.
+    _BUSY_TIMEOUT = 10.0
+
+    # Reading the capacitance or temperature register returns the
+    # previous measurement and arms a new one. If the last trigger()
+    # happened within this many seconds, the value waiting in the
+    # register is still fresh and the initial discard read is skipped.
+    _STALE_AFTER = 2.0
+
     def __init__(self, bus=1, address=0x20, min_moist=False, max_moist=False,
                  temp_scale='celsius', temp_offset=0, read_temp=True,
                  read_moist=True, read_light=True):
@@ -66,22 +201,59 @@ class Chirp(object):
                                          Default: True
         """
         self.bus_num = bus
-        self.bus = smbus.SMBus(bus)
-        self.busy_sleep = 0.01
+        self.bus, self._bus_lock, self._i2c_fd = _open_bus(bus)
+        self.busy_sleep = 0.001
         self.address = address
         self.min_moist = min_moist
         self.max_moist = max_moist
+        # Calibration is checked once here instead of with boolean
+        # tricks on every conversion. isinstance must exclude bool,
+        # since the False defaults would otherwise count as 0. A
+        # calibrated minimum of 0 is perfectly valid.
+        self._can_pct = (
+            isinstance(min_moist, (int, float)) and
+            isinstance(max_moist, (int, float)) and
+            not isinstance(min_moist, bool) and
+            not isinstance(max_moist, bool))
+        if self._can_pct:
+            if max_moist <= min_moist:
+                raise ValueError('max_moist must be larger than min_moist.')
+            # Precomputed so the percent conversion is one subtract and
+            # one multiply.
+            self._min_moist_f = float(min_moist)
+            self._moist_scale = 100.0 / (max_moist - min_moist)
         self.temp_scale = temp_scale
         self.temp_offset = temp_offset
+        # Look up the conversion function once, so the scale is
+        # validated here instead of on the Nth measurement.
+        try:
+            self._temp_convert = _TEMP_SCALES[temp_scale]
+        except KeyError:
+            raise ValueError(
+                '{} is not a valid temperature scale. Only celsius, farenheit \
+                and kelvin are supported.'.format(temp_scale))
         self.read_temp = read_temp
         self.read_moist = read_moist
         self.read_light = read_light
         self.temp = False
         self.moist = False
         self.light = False
-        self.temp_timestamp = datetime
-        self.moist_timestamp = datetime
-        self.light_timestamp = datetime
+        self._last_trigger = None
+
+        # Lazy caches for values that never change at runtime, filled
+        # on first access by the version and sensor_address properties.
+        self._version_cache = None
+        self._sensor_address_cache = None
+
+        # Timestamps are captured as cheap monotonic integers on the
+        # measurement path and converted to datetime lazily by the
+        # *_timestamp properties, using a wall-clock reference taken
+        # once here.
+        self._epoch_wall = time.time()
+        self._epoch_mono = time.monotonic_ns()
+        self._temp_ts_ns = None
+        self._moist_ts_ns = None
+        self._light_ts_ns = None
 
         # Register values
         self._GET_CAPACITANCE = 0x00  # (r) 2 bytes
@@ -95,15 +267,218 @@ class Chirp(object):
         self._SLEEP = 0x08            # (w) 0
         self._GET_BUSY = 0x09         # (r) 1
 
+    def _wait_ready(self, t_min):
+        """Wait for the sensor to finish the current measurement.
+
+        Sleeps out the minimum conversion time in one go, then polls the
+        busy flag at short intervals (busy_sleep) until the sensor is
+        ready. This keeps I2C traffic down compared to polling from the
+        start at a fixed rate.
+
+        The busy flag is read straight off the bus here rather than
+        through the busy property, so each poll costs one transaction
+        and no extra method call. The firmware only answers one register
+        per request, so the flag and the pending result cannot be
+        fetched in a single combined transaction.
+
+        Args:
+            t_min (float): Minimum conversion time in seconds for the
+                           triggered measurement.
+
+        Raises:
+            TimeoutError: If the sensor is still busy after _BUSY_TIMEOUT.
+        """
+        time.sleep(t_min)
+        # Bind everything the loop needs to locals, so each poll
+        # iteration avoids repeated attribute lookups.
+        read_byte = self.bus.read_byte_data
+        address = self.address
+        busy_reg = self._GET_BUSY
+        busy_sleep = self.busy_sleep
+        bus_lock = self._bus_lock
+        monotonic = time.monotonic
+        sleep = time.sleep
+        deadline = monotonic() + self._BUSY_TIMEOUT
+        while True:
+            with bus_lock:
+                busy = read_byte(address, busy_reg)
+            if not busy:
+                break
+            if monotonic() > deadline:
+                raise TimeoutError(
+                    'Sensor on address {} still busy after {} seconds.'.format(
+                        hex(address), self._BUSY_TIMEOUT))
+            sleep(busy_sleep)
+
     def trigger(self):
         """Triggers measurements on the activated sensors
+
+        The trigger commands for all activated sensors are issued first,
+        so their conversions run concurrently on the chip. The busy flag
+        is then awaited once and all results are collected, so the total
+        wait is roughly the slowest conversion instead of the sum of all
+        three.
+        """
+        t_min = 0
+        if self.read_temp:
+            self._start_temp()
+            t_min = max(t_min, self._T_MIN_TEMP)
+        if self.read_moist:
+            self._start_moist()
+            t_min = max(t_min, self._T_MIN_MOIST)
+        if self.read_light:
+            self._start_light()
+            t_min = max(t_min, self._T_MIN_LIGHT)
+
+        self._wait_ready(t_min)
+
+        if self.read_temp:
+            self.temp = self._finish_temp()
+        if self.read_moist:
+            self.moist = self._finish_moist()
+        if self.read_light:
+            self.light = self._finish_light()
+        self._last_trigger = time.monotonic()
+
+    def _ts_to_datetime(self, ts_ns):
+        """Convert a stored monotonic timestamp to a datetime.
+
+        Args:
+            ts_ns (int): Timestamp from time.monotonic_ns(), or None.
+
+        Returns:
+            datetime: Timestamp for the measurement. None if no
+                      measurement has been taken yet.
+        """
+        if ts_ns is None:
+            return None
+        return datetime.fromtimestamp(
+            self._epoch_wall + (ts_ns - self._epoch_mono) / 1e9)
+
+    @property
+    def temp_timestamp(self):
+        """Timestamp for the last temperature measurement.
+
+        Returns:
+            datetime: Timestamp for the measurement.
+        """
+        return self._ts_to_datetime(self._temp_ts_ns)
+
+    @property
+    def moist_timestamp(self):
+        """Timestamp for the last moisture measurement.
+
+        Returns:
+            datetime: Timestamp for the measurement.
+        """
+        return self._ts_to_datetime(self._moist_ts_ns)
+
+    @property
+    def light_timestamp(self):
+        """Timestamp for the last light measurement.
+
+        Returns:
+            datetime: Timestamp for the measurement.
         """
-        if self.read_temp is True:
-            self.temp = self._read_temp()
-        if self.read_moist is True:
-            self.moist = self._read_moist()
-        if self.read_light is True:
-            self.light = self._read_light()
+        return self._ts_to_datetime(self._light_ts_ns)
+
+    async def _wait_ready_async(self, t_min):
+        """Async counterpart to _wait_ready.
+
+        Yields to the event loop instead of blocking the thread while
+        the sensor converts, polling the busy flag through the default
+        executor.
+
+        Args:
+            t_min (float): Minimum conversion time in seconds for the
+                           triggered measurement.
+
+        Raises:
+            TimeoutError: If the sensor is still busy after _BUSY_TIMEOUT.
+        """
+        await asyncio.sleep(t_min)
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self._BUSY_TIMEOUT
+        while await loop.run_in_executor(None, lambda: self.busy):
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    'Sensor on address {} still busy after {} seconds.'.format(
+                        hex(self.address), self._BUSY_TIMEOUT))
+            await asyncio.sleep(self.busy_sleep)
+
+    async def trigger_async(self):
+        """Async counterpart to trigger().
+
+        The bus transactions run in the default executor and the
+        conversion wait yields to the event loop, so a trigger does not
+        freeze other coroutines. Several sensors can be measured
+        concurrently with asyncio.gather(), their conversion windows
+        then overlap in wall time.
+        """
+        loop = asyncio.get_running_loop()
+        t_min = 0
+        if self.read_temp:
+            await loop.run_in_executor(None, self._start_temp)
+            t_min = max(t_min, self._T_MIN_TEMP)
+        if self.read_moist:
+            await loop.run_in_executor(None, self._start_moist)
+            t_min = max(t_min, self._T_MIN_MOIST)
+        if self.read_light:
+            await loop.run_in_executor(None, self._start_light)
+            t_min = max(t_min, self._T_MIN_LIGHT)
+
+        await self._wait_ready_async(t_min)
+
+        if self.read_temp:
+            self.temp = await loop.run_in_executor(None, self._finish_temp)
+        if self.read_moist:
+            self.moist = await loop.run_in_executor(None, self._finish_moist)
+        if self.read_light:
+            self.light = await loop.run_in_executor(None, self._finish_light)
+        self._last_trigger = time.monotonic()
+
+    def _measurement_fresh(self):
+        """Check if the last trigger() was recent enough that the
+        measurement registers still hold fresh values.
+
+        Returns:
+            bool: True if triggered within _STALE_AFTER seconds.
+        """
+        return (self._last_trigger is not None and
+                time.monotonic() - self._last_trigger < self._STALE_AFTER)
+
+    def _read_block(self, reg, nbytes):
+        """Read a block of bytes from a register in one transaction.
+
+        A block read amortizes the I2C start/address/stop framing over
+        all requested bytes, so it is the cheapest way to get multi byte
+        values off the bus.
+
+        Args:
+            reg (int): Register number
+            nbytes (int): Number of bytes to read
+
+        Returns:
+            bytes: The raw register contents
+        """
+        with self._bus_lock:
+            if self._i2c_fd is not None:
+                try:
+                    return _cread_block(
+                        self._i2c_fd, self.address, reg, nbytes)
+                except OSError:
+                    # Kernel or bridge rejected the combined transfer,
+                    # stay on the SMBus paths from here on.
+                    self._i2c_fd = None
+            if i2c_msg is not None:
+                # One combined write+read transaction with a repeated
+                # start between the register and the data.
+                write = i2c_msg.write(self.address, [reg])
+                read = i2c_msg.read(self.address, nbytes)
+                self.bus.i2c_rdwr(write, read)
+                return bytes(read)
+            return bytes(
+                self.bus.read_i2c_block_data(self.address, reg, nbytes))
 
     def get_reg(self, reg):
         """Read 2 bytes from register
@@ -114,18 +489,24 @@ class Chirp(object):
         Returns:
             TYPE: 2 bytes
         """
-        val = self.bus.read_word_data(self.address, reg)
-        # return swapped bytes (they come in wrong order)
-        return (val >> 8) + ((val & 0xFF) << 8)
+        # Block read and big-endian decode, the bytes come in wrong
+        # order for read_word_data (which assumes little-endian).
+        return _U16BE(self._read_block(reg, 2))[0]
 
     @property
     def version(self):
         """Get firmware version for the sensor.
+        The firmware version is immutable, so it is only read from the
+        sensor once and cached.
 
         Returns:
             int: sensor firmware version
         """
-        return self.bus.read_byte_data(self.address, self._GET_VERSION)
+        if self._version_cache is None:
+            with self._bus_lock:
+                self._version_cache = self.bus.read_byte_data(
+                    self.address, self._GET_VERSION)
+        return self._version_cache
 
     @property
     def busy(self):
@@ -134,22 +515,21 @@ class Chirp(object):
         Returns:
             bool: true if busy taking measurements, else False
         """
-        busy = self.bus.read_byte_data(self.address, self._GET_BUSY)
-
-        if busy == 1:
-            return True
-        else:
-            return False
+        with self._bus_lock:
+            return bool(
+                self.bus.read_byte_data(self.address, self._GET_BUSY))
 
     def reset(self):
         """Reset sensor
         """
-        self.bus.write_byte(self.address, self._RESET)
+        with self._bus_lock:
+            self.bus.write_byte(self.address, self._RESET)
 
     def sleep(self):
         """Enter deep sleep mode
         """
-        self.bus.write_byte(self.address, self._SLEEP)
+        with self._bus_lock:
+            self.bus.write_byte(self.address, self._SLEEP)
 
     def wake_up(self, wake_time=1):
         """Wakes up the sensor from deep sleep mode
@@ -165,7 +545,8 @@ class Chirp(object):
         self.wake_time = wake_time
 
         try:
-            self.bus.read_byte_data(self.address, self._GET_VERSION)
+            with self._bus_lock:
+                self.bus.read_byte_data(self.address, self._GET_VERSION)
         except OSError:
             pass
         finally:
@@ -174,11 +555,17 @@ class Chirp(object):
     @property
     def sensor_address(self):
         """Read I2C address from the sensor
+        The address only changes through the setter below, so it is
+        read from the sensor once and cached.
 
         Returns:
             int: I2C address
         """
-        return self.bus.read_byte_data(self.address, self._GET_ADDRESS)
+        if self._sensor_address_cache is None:
+            with self._bus_lock:
+                self._sensor_address_cache = self.bus.read_byte_data(
+                    self.address, self._GET_ADDRESS)
+        return self._sensor_address_cache
 
     @sensor_address.setter
     def sensor_address(self, new_addr):
@@ -191,10 +578,12 @@ class Chirp(object):
             ValueError: If new_addr is not within required range.
         """
         if isinstance(new_addr, int) and (new_addr >= 3 and new_addr <= 119):
-            self.bus.write_byte_data(self.address, 1, new_addr)
-            self.bus.write_byte_data(self.address, 1, new_addr)
+            with self._bus_lock:
+                self.bus.write_byte_data(self.address, 1, new_addr)
+                self.bus.write_byte_data(self.address, 1, new_addr)
             self.reset()
             self.address = new_addr
+            self._sensor_address_cache = new_addr
         else:
             raise ValueError('I2C address must be between 3-119 or 0x03-0x77.')
 
@@ -209,66 +598,74 @@ class Chirp(object):
         Raises:
             ValueError: If min_moist and max_moist are not defined.
         """
-        moisture = self.moist
-        return self.moist_to_percent(moisture)
+        if not self._can_pct:
+            raise ValueError('min_moist and max_moist must be defined.')
+        return round((self.moist - self._min_moist_f) * self._moist_scale, 1)
 
     def moist_to_percent(self, moisture):
         """ Convert a moisture capacitance value to percent using a calibrated
         range for the sensor. Requires calibrated min_moist and max_moist
         values. Useful when converting values not directly from the sensor,
-        ie from a database.
+        ie from a database. Accepts a sequence of values, which is
+        converted in one vectorized pass if numpy is installed.
 
         Args:
-            moisture (int): The capitance/moisture value recieved from the sensor.
+            moisture (int or sequence): The capitance/moisture value(s)
+                recieved from the sensor.
         Returns:
-            int: Moisture in percent
+            int: Moisture in percent. A numpy array if a sequence was
+                 passed and numpy is installed.
 
         Raises:
             ValueError: If min_moist and max_moist are not defined.
         """
-        if (self.min_moist or self.max_moist) is False:
+        if not self._can_pct:
             raise ValueError('min_moist and max_moist must be defined.')
-        else:
-            return round((((moisture - self.min_moist) /
-                           (self.max_moist - self.min_moist)) * 100), 1)
+        if numpy is not None and not isinstance(moisture, (int, float)):
+            # Batch path, one subtract/multiply over the whole array.
+            return numpy.round(
+                (numpy.asarray(moisture) - self._min_moist_f) *
+                self._moist_scale, 1)
+        return round((moisture - self._min_moist_f) * self._moist_scale, 1)
+
+    def _start_moist(self):
+        """Arm a new soil moisture (capacitance) measurement.
+
+        Reading the capacitance register returns the previous value and
+        triggers a new measurement, so the read result is discarded.
+        Skipped if a recent trigger() already left a fresh one armed.
+        """
+        if not self._measurement_fresh():
+            self.get_reg(self._GET_CAPACITANCE)
 
-    def _read_moist(self):
-        """Read soil moisture (capacitance) from the sensor
+    def _finish_moist(self):
+        """Read out an armed soil moisture measurement.
+        The sensor must not be busy.
 
         Returns:
             int: Soil moisture
         """
-        # This returns last reading, and triggers a new. Discard old value.
-        measurement = self.get_reg(self._GET_CAPACITANCE)
+        self._moist_ts_ns = time.monotonic_ns()
+        return self.get_reg(self._GET_CAPACITANCE)
 
-        # Wait for sensor to finish measurement
-        while self.busy:
-            time.sleep(self.busy_sleep)
-        self.moist_timestamp = datetime.now()
+    def _start_temp(self):
+        """Arm a new temperature measurement.
 
-        # Retrieve the measurement just triggered.
-        measurement = self.get_reg(self._GET_CAPACITANCE)
-        return measurement
+        Reading the temperature register returns the previous value and
+        triggers a new measurement, so the read result is discarded.
+        Skipped if a recent trigger() already left a fresh one armed.
+        """
+        if not self._measurement_fresh():
+            self.get_reg(self._GET_TEMPERATURE)
 
-    def _read_temp(self):
-        """To read temperature, read 2 bytes from register 5. Returns degrees
-        in celsius with one decimal. Adjusted for temperature offset
+    def _finish_temp(self):
+        """Read out an armed temperature measurement.
+        The sensor must not be busy.
 
         Returns:
             float: Temperature in selected scale (temp_scale)
-
-        Raises:
-            ValueError: If temp_scale is not properly defined.
         """
-        # This returns last reading, and triggers a new. Discard old value.
-        measurement = self.get_reg(self._GET_TEMPERATURE)
-
-        # Wait for sensor to finish measurement
-        while self.busy:
-            time.sleep(self.busy_sleep)
-        self.temp_timestamp = datetime.now()
-
-        # Retrieve the measurement just triggered.
+        self._temp_ts_ns = time.monotonic_ns()
         measurement = self.get_reg(self._GET_TEMPERATURE)
 
         # The chirp sensor returns an integer. But the return measurement is
@@ -276,37 +673,24 @@ class Chirp(object):
         # dividing by ten. And adjusted for temperature offset (if used).
         celsius = round(((measurement / 10) + self.temp_offset), 1)
 
-        # Check which temperature scale to return the measurement in.
-        if self.temp_scale == 'celsius':
-            return celsius
-        elif self.temp_scale == 'farenheit':
-            # °F = (°C × 9/5) + 32
-            farenheit = (celsius * 9 / 5) + 32
-            return farenheit
-        elif self.temp_scale == 'kelvin':
-            # K = °C + 273.15
-            kelvin = celsius + 273.15
-            return kelvin
-        else:
-            raise ValueError(
-                '{} is not a valid temperature scale. Only celsius, farenheit \
-                and kelvin are supported.'.format(self.temp_scale))
+        # Convert to the temperature scale selected at construction.
+        return self._temp_convert(celsius)
 
-    def _read_light(self):
-        """ Measure light
+    def _start_light(self):
+        """Arm a new light measurement.
+        """
+        with self._bus_lock:
+            self.bus.write_byte(self.address, self._MEASURE_LIGHT)
+
+    def _finish_light(self):
+        """Read out an armed light measurement.
+        The sensor must not be busy. Takes longer in low light.
 
         Returns:
             int: Light measurement, 0 - 65535 (0 is bright, 65535 is dark)
         """
-        # Trigger a measurement
-        self.bus.write_byte(self.address, self._MEASURE_LIGHT)
-
-        # Wait for sensor to finish measurement. Takes longer in low light.
-        while self.busy:
-            time.sleep(self.busy_sleep)
-        self.light_timestamp = datetime.now()
-        measurement = self.get_reg(self._GET_LIGHT)
-        return measurement
+        self._light_ts_ns = time.monotonic_ns()
+        return self.get_reg(self._GET_LIGHT)
 
     def __repr__(self):
         """Summary
@@ -354,8 +738,8 @@ if __name__ == "__main__":
     min_moist = 240
     max_moist = 750
 
-    highest_measurement = False
-    lowest_measurement = False
+    highest_measurement = None
+    lowest_measurement = None
 
     # Initialize the sensor.
     chirp = Chirp(address=addr,
@@ -397,28 +781,38 @@ if __name__ == "__main__":
     print('Moisture  | Temp   | Brightness')
     print('-' * 31)
 
+    # Bound once outside the loop, so the format string is only parsed
+    # and looked up a single time.
+    out_fmt = '{:d} {:4.1f}% | {:3.1f}{} | {:d}'.format
+
+    # Target for the next sample on the monotonic clock. Sleeping until
+    # a fixed target instead of a fixed duration keeps the cadence at
+    # one sample per second regardless of how long the reads take.
+    next_sample = time.monotonic()
+
     try:
         # Endless loop, taking measurements.
         while True:
             # Trigger the sensors and take measurements.
             chirp.trigger()
-            output = '{:d} {:4.1f}% | {:3.1f}{} | {:d}'
-            output = output.format(chirp.moist, chirp.moist_percent,
-                                   chirp.temp, scale_sign, chirp.light)
-            print(output)
+            moist = chirp.moist
+            print(out_fmt(moist, chirp.moist_to_percent(moist),
+                          chirp.temp, scale_sign, chirp.light))
             # Adjust max and min measurement variables, used for calibrating
             # the sensor and allow using moisture percentage.
-            if highest_measurement is not False:
-                if chirp.moist > highest_measurement:
-                    highest_measurement = chirp.moist
+            if highest_measurement is None:
+                highest_measurement = lowest_measurement = moist
             else:
-                highest_measurement = chirp.moist
-            if lowest_measurement is not False:
-                if chirp.moist < lowest_measurement:
-                    lowest_measurement = chirp.moist
+                highest_measurement = max(highest_measurement, moist)
+                lowest_measurement = min(lowest_measurement, moist)
+            next_sample += 1.0
+            sleep_for = next_sample - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
             else:
-                lowest_measurement = chirp.moist
-            time.sleep(1)
+                # Measurements took longer than the interval. Skip the
+                # missed slots instead of bursting to catch up.
+                next_sample = time.monotonic()
     except KeyboardInterrupt:
         print('\nCtrl-C Pressed! Exiting.\n')
     finally: